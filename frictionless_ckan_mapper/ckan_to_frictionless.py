@@ -29,41 +29,38 @@ def resource(ckandict):
             package)
         * ~~Apply heuristic to unjsonify (if starts with [ or { unjsonify~~
         * JSON loads everything that starts with [ or {
-    3. Map keys from CKAN to Frictionless (and reformat if needed)
-    4. Remove keys with null values (CKAN has a lot of null valued keys)
+    3. Remove keys with null values (CKAN has a lot of null valued keys)
+    4. Map keys from CKAN to Frictionless (and reformat if needed). As
+       nulls are already gone, a null CKAN key (e.g. url) does not remove
+       the Frictionless key it maps to (e.g. path).
     5. Apply special formatting (if any) for key fields e.g. slugiify
     '''
-    # TODO: delete keys last as may be needed for something in processing
-    resource = dict(ckandict)
-    for key in resource_keys_to_remove:
-        if key in resource:
-            del resource[key]
-
-    # unjsonify values
-    # * check if string
-    # * if starts with [ or { => json.loads it ...
-    # HACK: bit of a hacky way to check if value is a jsonified array or
-    # dict
-    # * else do nothing
-    for key, value in resource.items():
+    # Unneeded keys and null values are dropped while copying so the
+    # resource is built in a single pass.
+    resource = {}
+    for key, value in ckandict.items():
+        if key in resource_keys_to_remove or value is None:
+            continue
+
+        # unjsonify values
+        # * check if string
+        # * if starts with [ or { => json.loads it ...
+        # HACK: bit of a hacky way to check if value is a jsonified array or
+        # dict
+        # * else do nothing
         if isinstance(value, str):
-            value = value.strip()
-            if value.startswith('{') or value.startswith('['):
+            stripped = value.strip()
+            if stripped.startswith('{') or stripped.startswith('['):
                 try:
-                    value = json.loads(value)
-                    resource[key] = value
+                    value = json.loads(stripped)
                 except (json_parse_exception, TypeError):
                     pass
+        resource[key] = value
 
     # Remap differences from CKAN to Frictionless resource
     for key, value in resource_mapping.items():
         if key in resource:
-            resource[value] = resource[key]
-            del resource[key]
-
-    for key in list(resource.keys()):
-        if resource[key] is None:
-            del resource[key]
+            resource[value] = resource.pop(key)
 
     return resource
 
@@ -79,6 +76,11 @@ dataset_mapping = {
     'notes': 'description',
     'url': 'homepage'
 }
+license_mapping = {
+    'license_id': 'name',
+    'license_title': 'title',
+    'license_url': 'path'
+}
 
 
 def dataset(ckandict):
@@ -117,8 +119,9 @@ def dataset(ckandict):
                                 ckandict['resources']]
 
     # tags
-    if ckandict.get('tags'):
-        outdict['keywords'] = [tag['name'] for tag in ckandict['tags']]
+    tags = ckandict.get('tags')
+    if tags:
+        outdict['keywords'] = [tag['name'] for tag in tags]
     outdict.pop('tags', None)
 
     # author, maintainer => contributors
@@ -128,25 +131,20 @@ def dataset(ckandict):
     # 3. merge i.e. use contributors and merge in (this is sort of complex)
     # e.g. how to i avoid duplicating the same person
     # ANS: for now, is 1 ...
-    if (not ('contributors' in outdict and outdict['contributors']) and
+    if (not outdict.get('contributors') and
             ('author' in outdict or 'maintainer' in outdict)):
-        outdict['contributors'] = []
-        if 'author' in outdict and outdict['author']:
-            contrib = {
-                'title': outdict['author'],
-                'role': 'author'
-            }
-            if 'author_email' in outdict:
-                contrib['email'] = outdict['author_email']
-            outdict['contributors'].append(contrib)
-        if 'maintainer' in outdict and outdict['maintainer']:
-            contrib = {
-                'title': outdict['maintainer'],
-                'role': 'maintainer'
-            }
-            if 'maintainer_email' in outdict:
-                contrib['email'] = outdict['maintainer_email']
-            outdict['contributors'].append(contrib)
+        contributors = outdict['contributors'] = []
+        for role in ['author', 'maintainer']:
+            title = outdict.get(role)
+            if title:
+                contrib = {
+                    'title': title,
+                    'role': role
+                }
+                email_key = role + '_email'
+                if email_key in outdict:
+                    contrib['email'] = outdict[email_key]
+                contributors.append(contrib)
 
     for key in ['author', 'author_email', 'maintainer', 'maintainer_email']:
         outdict.pop(key, None)
@@ -159,19 +157,13 @@ def dataset(ckandict):
 
     # Looping like this because all those keys are optional according to the
     # docs (though usually license_id will be there if others are there).
-    for key in ['license_id', 'license_title', 'license_url']:
-        if key in outdict and 'licenses' not in outdict:
-            outdict['licenses'] = [{}]
-            break  # check to create list of dicts only once
-    if 'license_id' in outdict:
-        outdict['licenses'][0]['name'] = outdict['license_id']
-        outdict.pop('license_id', None)
-    if 'license_title' in outdict:
-        outdict['licenses'][0]['title'] = outdict['license_title']
-        outdict.pop('license_title', None)
-    if 'license_url' in outdict:
-        outdict['licenses'][0]['path'] = outdict['license_url']
-        outdict.pop('license_url', None)
+    # Null values are skipped so they don't end up inside the license.
+    for key, value in license_mapping.items():
+        license_value = outdict.pop(key, None)
+        if license_value is not None:
+            if not outdict.get('licenses'):
+                outdict['licenses'] = [{}]
+            outdict['licenses'][0][value] = license_value
 
     for key in dataset_keys_to_remove:
         outdict.pop(key, None)
@@ -18,10 +18,16 @@ package_mapping = {
     'homepage': 'url',
 }
 
-# Any key not in this list is passed as is inside "extras".
+license_mapping = {
+    'name': 'license_id',
+    'title': 'license_title',
+    'path': 'license_url'
+}
+
+# Any key not in this set is passed as is inside "extras".
 # Further processing will happen for possible matchings, e.g.
 # contributor <=> author
-ckan_package_keys = [
+ckan_package_keys = frozenset([
     'author',
     'author_email',
     'creator_user_id',
@@ -49,11 +55,11 @@ ckan_package_keys = [
     'type',
     'url',
     'version'
-]
+])
 
-frictionless_package_keys_to_exclude = [
+frictionless_package_keys_to_exclude = frozenset([
     'extras'
-]
+])
 
 
 def resource(fddict):
@@ -69,8 +75,7 @@ def resource(fddict):
     # Remap differences from Frictionless to CKAN resource
     for key, value in resource_mapping.items():
         if key in resource:
-            resource[value] = resource[key]
-            del resource[key]
+            resource[value] = resource.pop(key)
 
     return resource
 
@@ -96,22 +101,23 @@ def package(fddict):
     if 'resources' in fddict:
         outdict['resources'] = [resource(res) for res in fddict['resources']]
 
-    if 'licenses' in outdict and outdict['licenses']:
-        outdict['license_id'] = outdict['licenses'][0].get('name')
-        outdict['license_title'] = outdict['licenses'][0].get('title')
-        outdict['license_url'] = outdict['licenses'][0].get('path')
+    licenses = outdict.get('licenses')
+    if licenses:
+        for key, value in license_mapping.items():
+            outdict[value] = licenses[0].get(key)
         # remove it so it won't get put in extras
-        if len(outdict['licenses']) == 1:
+        if len(licenses) == 1:
             outdict.pop('licenses', None)
 
-    if outdict.get('contributors'):
-        for c in outdict['contributors']:
+    contributors = outdict.get('contributors')
+    if contributors:
+        for c in contributors:
             if c.get('role') in [None, 'author']:
                 outdict['author'] = c.get('title')
                 outdict['author_email'] = c.get('email')
                 break
 
-        for c in outdict['contributors']:
+        for c in contributors:
             if c.get('role') == 'maintainer':
                 outdict['maintainer'] = c.get('title')
                 outdict['maintainer_email'] = c.get('email')
@@ -123,40 +129,35 @@ def package(fddict):
         # when have we extracted everything?
         # if contributors has length 1 and role in author or maintainer
         # or contributors == 2 and no of authors and maintainer types <= 1
+        roles = [c.get('role') for c in contributors]
         if (
-            (len(outdict.get('contributors')) == 1 and
-                outdict['contributors'][0].get('role') in [None, 'author',
-                    'maintainer'])
+            (len(roles) == 1 and
+                roles[0] in [None, 'author', 'maintainer'])
             or
-            (len(outdict.get('contributors')) == 2 and
-                [c.get('role') for c in outdict['contributors']]
-                not in (
+            (len(roles) == 2 and
+                roles not in (
                     [None, None],
                     ['maintainer', 'maintainer'],
                     ['author', 'author']))
                     ):
             outdict.pop('contributors', None)
 
-    if outdict.get('keywords'):
-        outdict['tags'] = [
-            {'name': keyword} for keyword in outdict['keywords']
-        ]
+    keywords = outdict.get('keywords')
+    if keywords:
+        outdict['tags'] = [{'name': keyword} for keyword in keywords]
         del outdict['keywords']
 
-    final_dict = dict(outdict)
-    for key, value in outdict.items():
+    extras = []
+    for key in list(outdict.keys()):
         if (
             key not in ckan_package_keys and
             key not in frictionless_package_keys_to_exclude
         ):
+            value = outdict.pop(key)
             if isinstance(value, (dict, list)):
                 value = json.dumps(value)
-            if not final_dict.get('extras'):
-                final_dict['extras'] = []
-            final_dict['extras'].append(
-                {'key': key, 'value': value}
-            )
-            del final_dict[key]
-    outdict = dict(final_dict)
+            extras.append({'key': key, 'value': value})
+    if extras:
+        outdict['extras'] = (outdict.get('extras') or []) + extras
 
     return outdict
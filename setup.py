@@ -17,9 +17,7 @@ def read(*paths):
 # Prepare
 PACKAGE = 'frictionless_ckan_mapper'
 NAME = PACKAGE.replace('_', '-')
-INSTALL_REQUIRES = [
-    'six>=1.9,<2.0'
-]
+INSTALL_REQUIRES = []
 TESTS_REQUIRE = [
     'pylama',
     'tox'
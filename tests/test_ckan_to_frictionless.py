@@ -123,6 +123,35 @@ class TestResourceConversion:
         out = converter.resource(indict)
         assert out == exp
 
+    def test_null_mapped_keys_keep_frictionless_keys(self):
+        '''A null CKAN key does not remove the Frictionless key it maps to'''
+        indict = {
+            'url': None,
+            'path': 'http://www.somewhere.com/data.csv',
+            'size': None,
+            'bytes': 5,
+            'mimetype': None,
+            'mediatype': 'text/csv'
+        }
+        exp = {
+            'path': 'http://www.somewhere.com/data.csv',
+            'bytes': 5,
+            'mediatype': 'text/csv'
+        }
+        out = converter.resource(indict)
+        assert out == exp
+
+        # A non-null CKAN key still takes precedence
+        indict = {
+            'url': 'http://www.somewhere.com/data.csv',
+            'path': 'http://www.elsewhere.com/data.csv'
+        }
+        exp = {
+            'path': 'http://www.somewhere.com/data.csv'
+        }
+        out = converter.resource(indict)
+        assert out == exp
+
 
 class TestPackageConversion:
     def test_dataset_extras(self):
@@ -169,6 +198,21 @@ class TestPackageConversion:
         }
         assert out == exp
 
+    def test_extra_values_are_parsed_exactly(self):
+        # Big integers must stay exact ints and not become lossy floats
+        indict = {
+            'extras': [
+                {'key': 'ident', 'value': '12345678901234567890123'},
+                {'key': 'idents', 'value': '[12345678901234567890123]'}
+            ]
+        }
+        exp = {
+            'ident': 12345678901234567890123,
+            'idents': [12345678901234567890123]
+        }
+        out = converter.dataset(indict)
+        assert out == exp
+
     def test_dataset_license(self):
         # No license_title nor license_url
         indict = {
@@ -198,6 +242,44 @@ class TestPackageConversion:
         out = converter.dataset(indict)
         assert out == exp
 
+    def test_dataset_license_null_values(self):
+        # CKAN returns null for unset license fields
+        indict = {
+            'license_id': 'cc-by',
+            'license_title': None,
+            'license_url': None
+        }
+        exp = {
+            'licenses': [{
+                'name': 'cc-by'
+            }]
+        }
+        out = converter.dataset(indict)
+        assert out == exp
+
+        indict = {
+            'license_id': None,
+            'license_title': None,
+            'license_url': None
+        }
+        exp = {}
+        out = converter.dataset(indict)
+        assert out == exp
+
+    def test_dataset_license_with_empty_licenses_in_extras(self):
+        # This used to raise an IndexError
+        indict = {
+            'license_id': 'cc-by',
+            'extras': [{'key': 'licenses', 'value': '[]'}]
+        }
+        exp = {
+            'licenses': [{
+                'name': 'cc-by'
+            }]
+        }
+        out = converter.dataset(indict)
+        assert out == exp
+
     def test_dataset_license_with_licenses_in_extras(self):
         indict = {
             'license_id': 'odc-odbl',
@@ -264,6 +264,23 @@ class TestPackageConversion:
         out['extras'] = sorted(out['extras'], key=lambda i: i['key'])
         assert out == exp
 
+    def test_existing_extras_are_kept(self):
+        extras = [{'key': 'oldkey', 'value': 'old value'}]
+        indict = {
+            'extras': extras,
+            'newkey': 'new value'
+        }
+        exp = {
+            'extras': [
+                {'key': 'oldkey', 'value': 'old value'},
+                {'key': 'newkey', 'value': 'new value'}
+            ]
+        }
+        out = converter.package(indict)
+        assert out == exp
+        # the input extras are left untouched
+        assert extras == [{'key': 'oldkey', 'value': 'old value'}]
+
     def test_resources_are_converted(self):
         indict = {
             'name': 'gdp',
@@ -1,10 +1,9 @@
 import json
+import sys
 
 import frictionless_ckan_mapper.ckan_to_frictionless as ckan_to_frictionless
 import frictionless_ckan_mapper.frictionless_to_ckan as frictionless_to_ckan
 
-import six
-
 
 class TestPackageConversion:
     def test_round_trip_ckan(self):
@@ -24,7 +23,7 @@ class TestPackageConversion:
         # Solution 2: Hard code the dicts as in `test_extras_is_converted`
         # in test_frictionless_to_ckan.py instead of loading JSON and
         # sort the keys.
-        if not six.PY2:
+        if sys.version_info[0] > 2:
             assert ckan2 == ckan3
 
     def test_differences_ckan_round_trip(self):
@@ -47,7 +46,7 @@ class TestPackageConversion:
         # Solution 2: Hard code the dicts as in `test_extras_is_converted`
         # in test_frictionless_to_ckan.py instead of loading JSON and
         # sort the keys.
-        if not six.PY2:
+        if sys.version_info[0] > 2:
             assert ckan2 == exp
 
         # Notable differences in `exp` from ckan1 are: